@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Web Scraper API"
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here")
     ALLOWED_HOSTS: List[str] = ["*"]
+    # Enforce bearer-token auth on /api/v1/* via the ASGI middleware
+    API_AUTH_ENABLED: bool = os.getenv("API_AUTH_ENABLED", "false").lower() == "true"
 
     # Scraper Settings
     MAX_WORKERS: int = 5  # Maximum number of browser instances
@@ -28,6 +30,9 @@ class Settings(BaseSettings):
     )
     SCREENSHOT_QUALITY: int = 80
 
+    # Metrics Settings
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
     # Cache Settings
     REDIS_URL: str = "redis://redis:6379"
     CACHE_TTL: int = 86400  # 24 hours in seconds
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, HttpUrl, validator, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_validator, Field, PrivateAttr
 from typing import Optional, List, Pattern
 import re
 from uuid import UUID, uuid4
 
+from models.request import HttpUrlStr
+
 class CrawlerRequest(BaseModel):
     """
     Request model for the crawler endpoint.
@@ -16,7 +18,7 @@ class CrawlerRequest(BaseModel):
         respect_robots_txt (bool): Whether to respect robots.txt rules
         crawl_id (UUID): Unique identifier for the crawl request
     """
-    url: HttpUrl
+    url: HttpUrlStr
     max_depth: Optional[int] = Field(default=3, ge=1, le=10, description="Maximum depth to crawl")
     max_pages: Optional[int] = Field(default=100, ge=1, le=1000, description="Maximum pages to crawl")
     exclude_patterns: Optional[List[str]] = Field(default=[], description="URL patterns to exclude")
@@ -24,7 +26,47 @@ class CrawlerRequest(BaseModel):
     respect_robots_txt: Optional[bool] = Field(default=True, description="Whether to respect robots.txt")
     crawl_id: UUID = Field(default_factory=uuid4, description="Unique identifier for the crawl")
 
-    @validator('exclude_patterns', 'include_patterns')
+    # Compiled forms of the URL patterns, built once per request so the
+    # crawler's URL-filter loop never re-compiles per candidate URL
+    _compiled_exclude: Optional[List[Pattern]] = PrivateAttr(default=None)
+    _compiled_include: Optional[List[Pattern]] = PrivateAttr(default=None)
+    _exclude_union: Optional[Pattern] = PrivateAttr(default=None)
+    _include_union: Optional[Pattern] = PrivateAttr(default=None)
+
+    def compiled_exclude_patterns(self) -> List[Pattern]:
+        """Return the exclude patterns as compiled regex objects"""
+        if self._compiled_exclude is None:
+            self._compiled_exclude = [re.compile(p) for p in (self.exclude_patterns or [])]
+        return self._compiled_exclude
+
+    def compiled_include_patterns(self) -> List[Pattern]:
+        """Return the include patterns as compiled regex objects"""
+        if self._compiled_include is None:
+            self._compiled_include = [re.compile(p) for p in (self.include_patterns or [])]
+        return self._compiled_include
+
+    def matches_exclude(self, url: str) -> bool:
+        """Check the URL against all exclude patterns in a single regex pass"""
+        if not self.exclude_patterns:
+            return False
+        if self._exclude_union is None:
+            self._exclude_union = re.compile("|".join(f"(?:{p})" for p in self.exclude_patterns))
+        return self._exclude_union.search(url) is not None
+
+    def matches_include(self, url: str) -> bool:
+        """Check the URL against all include patterns in a single regex pass.
+
+        Returns True when no include patterns are configured, mirroring the
+        crawler's default of accepting everything not excluded.
+        """
+        if not self.include_patterns:
+            return True
+        if self._include_union is None:
+            self._include_union = re.compile("|".join(f"(?:{p})" for p in self.include_patterns))
+        return self._include_union.search(url) is not None
+
+    @field_validator('exclude_patterns', 'include_patterns', mode='after')
+    @classmethod
     def validate_patterns(cls, v):
         """Validate that patterns are valid regex expressions"""
         if v:
@@ -35,8 +77,8 @@ class CrawlerRequest(BaseModel):
                     raise ValueError(f"Invalid regex pattern: {pattern}, error: {str(e)}")
         return v
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com",
                 "max_depth": 3,
@@ -45,4 +87,9 @@ class CrawlerRequest(BaseModel):
                 "include_patterns": [r"\/blog\/.*", r"\/docs\/.*"],
                 "respect_robots_txt": True
             }
-        }
\ No newline at end of file
+        }
+    )
+
+# JSON schema computed once at import; OpenAPI/doc consumers should use this
+# instead of re-deriving it per call
+CRAWLER_REQUEST_SCHEMA = CrawlerRequest.model_json_schema()
\ No newline at end of file
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, HttpUrl, Field, computed_field
 from typing import List, Dict, Optional, Any
 from uuid import UUID
 from enum import Enum
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import time
 
 class CrawlStatus(str, Enum):
     """Enum for crawl status"""
@@ -17,19 +19,34 @@ class CrawledPage(BaseModel):
     markdown: str
     structured_data: Dict[str, Any]
     scrape_id: UUID
-    crawled_at: datetime = Field(default_factory=datetime.utcnow)
+    # Store the creation instant as a float epoch; building a datetime (and
+    # its tzinfo machinery) per page is deferred until serialization
+    crawled_at_ts: float = Field(default_factory=time.time, exclude=True)
     depth: int = Field(ge=0)
     parent_url: Optional[HttpUrl] = None
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def crawled_at(self) -> datetime:
+        return datetime.fromtimestamp(self.crawled_at_ts, tz=timezone.utc)
+
     class Config:
         arbitrary_types_allowed = True
 
-class CrawlStats(BaseModel):
-    """Model for crawl statistics"""
+@dataclass(slots=True)
+class CrawlStats:
+    """Crawl statistics.
+
+    A slotted dataclass rather than a BaseModel: stats objects are pure
+    internal counters mutated per page, so they skip Pydantic's validator
+    machinery on construction and per-instance __dict__ allocation.
+    Pydantic v2 still validates/serializes it natively as a field type.
+    """
+    start_time: datetime
     total_pages: int = 0
     success_count: int = 0
     failed_count: int = 0
     skipped_count: int = 0
-    start_time: datetime
     end_time: Optional[datetime] = None
     duration_seconds: Optional[float] = None
 
@@ -1,5 +1,15 @@
-from pydantic import BaseModel, HttpUrl
-from typing import List, Optional, Dict, Any
+from pydantic import AfterValidator, BaseModel, HttpUrl
+from typing import Annotated, List, Optional, Dict, Any
+
+def _validate_http_url(v: str) -> str:
+    """Validate as HttpUrl once at parse time, then carry a plain str.
+
+    HttpUrl.__str__ rebuilds the normalized URL on every call; validating
+    up front keeps the hot handler path free of that cost.
+    """
+    return str(HttpUrl(v))
+
+HttpUrlStr = Annotated[str, AfterValidator(_validate_http_url)]
 
 class Action(BaseModel):
     type: str
@@ -16,7 +26,7 @@ class ExtractConfig(BaseModel):
     prompt: Optional[str] = None
 
 class ScrapeRequest(BaseModel):
-    url: HttpUrl
+    url: HttpUrlStr
     formats: List[str]
     onlyMainContent: Optional[bool] = True
     includeTags: Optional[List[str]] = None
@@ -1,24 +1,34 @@
 from typing import Optional, Any, Dict
-import aioredis
+import redis.asyncio as redis
 import json
 import hashlib
+import time
+import random
 from datetime import timedelta
+from cachetools import TTLCache
 from loguru import logger
 
+# In-process L1 settings: short TTL (well below the Redis TTL) so per-worker
+# copies of hot entries stay fresh while skipping the Redis round-trip
+L1_CACHE_MAXSIZE = 2048
+L1_CACHE_TTL = 60
+
 class CacheService:
     """Redis-based caching service for web scraping results"""
-    
+
     def __init__(self, redis_url: str = "redis://redis:6379"):
         """Initialize cache service"""
         self.redis = None
         self.redis_url = redis_url
         self.default_ttl = timedelta(hours=24)  # Default cache TTL
+        # L1: per-worker in-process cache in front of Redis (L2)
+        self._l1_cache = TTLCache(maxsize=L1_CACHE_MAXSIZE, ttl=L1_CACHE_TTL)
 
     async def connect(self):
         """Establish Redis connection"""
         if not self.redis:
             try:
-                self.redis = await aioredis.from_url(
+                self.redis = await redis.from_url(
                     self.redis_url,
                     encoding="utf-8",
                     decode_responses=True
@@ -31,7 +41,7 @@ class CacheService:
     async def disconnect(self):
         """Close Redis connection"""
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
             self.redis = None
 
     def _generate_cache_key(self, url: str, options: Dict[str, Any]) -> str:
@@ -50,23 +60,44 @@ class CacheService:
         
         cache_key_parts.append(json.dumps(relevant_options, sort_keys=True))
         
-        # Generate hash
+        # Generate hash. blake2b: several times faster than sha256 on
+        # short inputs and nothing here needs a cryptographic guarantee
         key_string = '|'.join(str(part) for part in cache_key_parts)
-        return f"scrape:{hashlib.sha256(key_string.encode()).hexdigest()}"
+        return f"scrape:{hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()}"
+
+    def make_key(self, url: str, options: Dict[str, Any]) -> str:
+        """Public helper for callers that hit several cache methods with
+        the same (url, options) pair and want to pay for the key once"""
+        return self._generate_cache_key(url, options)
 
-    async def get_cached_result(self, url: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def get_cached_result(self, url: str, options: Dict[str, Any],
+                                cache_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Retrieve cached scraping result"""
         if not self.redis:
             await self.connect()
             
         try:
-            cache_key = self._generate_cache_key(url, options)
+            cache_key = cache_key or self._generate_cache_key(url, options)
+
+            # L1 hit: skip the Redis round-trip entirely. Probabilistic
+            # early expiry near end-of-life spreads out refreshes so all
+            # workers don't stampede Redis when an entry lapses.
+            l1_entry = self._l1_cache.get(cache_key)
+            if l1_entry is not None:
+                stored_at, result = l1_entry
+                elapsed = time.time() - stored_at
+                if random.random() >= (elapsed / L1_CACHE_TTL) ** 8:
+                    logger.debug(f"L1 cache hit for URL: {url}")
+                    return result
+
             cached_data = await self.redis.get(cache_key)
-            
+
             if cached_data:
                 logger.info(f"Cache hit for URL: {url}")
-                return json.loads(cached_data)
-            
+                result = json.loads(cached_data)
+                self._l1_cache[cache_key] = (time.time(), result)
+                return result
+
             logger.info(f"Cache miss for URL: {url}")
             return None
             
@@ -75,16 +106,18 @@ class CacheService:
             return None
 
     async def cache_result(self, url: str, options: Dict[str, Any], 
-                          result: Dict[str, Any], ttl: Optional[timedelta] = None) -> bool:
+                          result: Dict[str, Any], ttl: Optional[timedelta] = None,
+                          cache_key: Optional[str] = None) -> bool:
         """Cache scraping result"""
         if not self.redis:
             await self.connect()
             
         try:
-            cache_key = self._generate_cache_key(url, options)
+            cache_key = cache_key or self._generate_cache_key(url, options)
             ttl = ttl or self.default_ttl
             
-            # Store result
+            # Store result in both tiers
+            self._l1_cache[cache_key] = (time.time(), result)
             await self.redis.set(
                 cache_key,
                 json.dumps(result),
@@ -98,13 +131,15 @@ class CacheService:
             logger.error(f"Error caching result: {str(e)}")
             return False
 
-    async def invalidate_cache(self, url: str, options: Dict[str, Any]) -> bool:
+    async def invalidate_cache(self, url: str, options: Dict[str, Any],
+                               cache_key: Optional[str] = None) -> bool:
         """Invalidate cached result for specific URL and options"""
         if not self.redis:
             await self.connect()
             
         try:
-            cache_key = self._generate_cache_key(url, options)
+            cache_key = cache_key or self._generate_cache_key(url, options)
+            self._l1_cache.pop(cache_key, None)
             await self.redis.delete(cache_key)
             logger.info(f"Invalidated cache for URL: {url}")
             return True
@@ -3,7 +3,6 @@ import asyncio
 import uuid
 from datetime import datetime
 from loguru import logger
-from concurrent.futures import ThreadPoolExecutor
 
 from services.scraper.scraper import WebScraper
 from .link_extractor import LinkExtractor
@@ -20,13 +19,16 @@ class CrawlerService:
     Production-grade crawler service that orchestrates web crawling.
     """
     
-    def __init__(self, max_concurrent: int = 5, worker_threads: int = 3):
+    def __init__(self, max_concurrent: int = 5, worker_threads: int = 3,
+                 http_client=None):
         self.max_concurrent = max_concurrent
         self.worker_threads = worker_threads
+        # Shared httpx.AsyncClient owned by the application lifespan; used
+        # for lightweight fetches (e.g. robots.txt) so they reuse one
+        # connection pool
+        self.http_client = http_client
         self.scraper = WebScraper(max_concurrent=max_concurrent)
         self.active_crawls: Dict[uuid.UUID, CrawlerResponse] = {}
-        self._lock = asyncio.Lock()
-        self._executor = ThreadPoolExecutor(max_workers=worker_threads)
         self._semaphore = asyncio.Semaphore(max_concurrent)
 
     async def _process_page(self, url: str, depth: int, 
@@ -63,31 +65,71 @@ class CrawlerService:
                         scrape_result["data"]["html"],
                         url
                     )
-                    
-                    async with self._lock:
-                        for link in new_links:
-                            await queue_manager.add_url(link, depth + 1, url)
-                
-                # Store the page
-                async with self._lock:
-                    response.pages.append(page)
-                    response.stats.success_count += 1
-                    logger.info(f"Successfully processed {url}")
-            
+
+                    # Filter out URLs already seen anywhere in this crawl
+                    # before touching the queue, so repeated footer/nav
+                    # links don't churn the lock per page
+                    new_links = [
+                        link for link in new_links
+                        if link not in queue_manager.seen_urls
+                    ]
+
+                    for link in new_links:
+                        await queue_manager.add_url(link, depth + 1, url)
+
+                # Store the page. No lock needed: these are synchronous
+                # list/int mutations on the event loop thread, so tasks
+                # cannot interleave mid-update; the old shared lock just
+                # serialized every page on one contention point
+                response.pages.append(page)
+                response.stats.success_count += 1
+                logger.info(f"Successfully processed {url}")
+
             else:
-                async with self._lock:
-                    response.stats.failed_count += 1
+                response.stats.failed_count += 1
                 logger.error(f"Failed to scrape {url}")
-                
+
         except Exception as e:
-            async with self._lock:
-                response.stats.failed_count += 1
+            response.stats.failed_count += 1
             logger.error(f"Error processing {url}: {str(e)}")
             
         finally:
             await queue_manager.mark_complete(url)
 
     
+    async def _crawl_worker(self, queue_manager: QueueManager,
+                            link_extractor: LinkExtractor,
+                            response: CrawlerResponse,
+                            request: CrawlerRequest,
+                            n_workers: int) -> None:
+        """Worker coroutine: processes URLs until the queue closes"""
+        while True:
+            url = await queue_manager.get_next_url_blocking()
+            if url is None:
+                break
+
+            if len(response.pages) >= request.max_pages:
+                logger.info(f"Reached max pages limit: {request.max_pages}")
+                await queue_manager.mark_complete(url)
+                queue_manager.close(n_workers)
+                break
+
+            depth = queue_manager.get_depth(url)
+            await self._process_page(
+                url=url,
+                depth=depth,
+                queue_manager=queue_manager,
+                link_extractor=link_extractor,
+                response=response,
+                request=request
+            )
+
+            # Close the queue once there is nothing queued or in flight
+            # (or the page budget is spent) so blocked workers wake up
+            if queue_manager.is_complete or len(response.pages) >= request.max_pages:
+                queue_manager.close(n_workers)
+                break
+
     async def crawl_sync(self, request: CrawlerRequest) -> CrawlerResponse:
         """
         Perform synchronous crawl and wait for completion.
@@ -97,6 +139,7 @@ class CrawlerService:
         # Initialize components
         queue_manager = QueueManager(request)
         link_extractor = LinkExtractor(request)
+        await link_extractor.ensure_robots(self.http_client)
         
         # Create response object
         response = CrawlerResponse(
@@ -115,57 +158,25 @@ class CrawlerService:
             # Add initial URL
             logger.debug("Adding initial URL to queue")
             await queue_manager.add_url(str(request.url))
-            
-            while True:
-                # Check completion conditions first
-                if queue_manager.is_complete:
-                    logger.debug("Queue is complete, breaking")
-                    break
-
-                if len(response.pages) >= request.max_pages:
-                    logger.info(f"Reached max pages limit: {request.max_pages}")
-                    break
-
-                # Get URLs to process
-                processing_urls = []
-                async with self._lock:
-                    # Get batch of URLs to process
-                    remaining_slots = request.max_pages - len(response.pages)
-                    batch_size = min(self.worker_threads, remaining_slots)
-                    
-                    for _ in range(batch_size):
-                        url = await queue_manager.get_next_url()
-                        if url:
-                            processing_urls.append(url)
-                
-                if not processing_urls:
-                    # No URLs available, check if we're really done
-                    if not queue_manager.in_progress and queue_manager.queue.empty():
-                        logger.debug("No URLs in queue and none in progress, breaking")
-                        break
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                # Process URLs in parallel
-                tasks = []
-                for url in processing_urls:
-                    depth = queue_manager.get_depth(url)
-                    task = asyncio.create_task(
-                        self._process_page(
-                            url=url,
-                            depth=depth,
-                            queue_manager=queue_manager,
-                            link_extractor=link_extractor,
-                            response=response,
-                            request=request
-                        )
+
+            # Long-lived workers pull from the queue directly: no idle
+            # polling sleep and no batch barrier where every worker waits
+            # on the slowest URL before the next batch starts
+            n_workers = self.max_concurrent
+            workers = [
+                asyncio.create_task(
+                    self._crawl_worker(
+                        queue_manager=queue_manager,
+                        link_extractor=link_extractor,
+                        response=response,
+                        request=request,
+                        n_workers=n_workers
                     )
-                    tasks.append(task)
-                
-                if tasks:
-                    await asyncio.gather(*tasks)
-                    logger.debug(f"Processed batch of {len(tasks)} URLs")
-            
+                )
+                for _ in range(n_workers)
+            ]
+            await asyncio.gather(*workers)
+
             # Update final statistics
             response.status = CrawlStatus.COMPLETED
             response.stats.end_time = datetime.utcnow()
@@ -206,7 +217,6 @@ class CrawlerService:
     async def cleanup(self):
         """Cleanup resources"""
         try:
-            self._executor.shutdown(wait=False)
             await self.scraper.cleanup()
             self.active_crawls.clear()
         except Exception as e:
@@ -1,12 +1,40 @@
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from lxml import html as lxml_html
 import re
 from loguru import logger
 import robotexclusionrulesparser
 import requests
 from models.crawler_request import CrawlerRequest
 
+# robots.txt parsers shared across crawls, keyed by (scheme, netloc):
+# repeated crawls of the same host skip the fetch+parse entirely
+_robots_cache: Dict[Tuple[str, str], robotexclusionrulesparser.RobotExclusionRulesParser] = {}
+
+@lru_cache(maxsize=100_000)
+def _normalize_url_cached(url: str, base_url: str) -> Optional[Tuple[str, str]]:
+    """Normalize a URL to absolute form, returning (normalized, netloc).
+
+    Module-level and memoized: the same footer/nav hrefs repeat on nearly
+    every page of a crawl, so repeated urljoin/urlparse work is skipped.
+    """
+    try:
+        absolute_url = urljoin(base_url, url)
+        parsed = urlparse(absolute_url)
+
+        # Basic normalization
+        normalized = parsed._replace(
+            fragment="",  # Remove fragments
+            params="",    # Remove params
+            query=""     # Remove query string
+        ).geturl()
+
+        return normalized, parsed.netloc
+    except Exception as e:
+        logger.debug(f"URL normalization failed for {url}: {e}")
+        return None
+
 class LinkExtractor:
     """
     Extracts and validates links from HTML content.
@@ -21,106 +49,120 @@ class LinkExtractor:
             request (CrawlerRequest): The crawler request containing settings
         """
         self.base_domain = urlparse(str(request.url)).netloc
-        self.exclude_patterns = [re.compile(p) for p in request.exclude_patterns] if request.exclude_patterns else []
-        self.include_patterns = [re.compile(p) for p in request.include_patterns] if request.include_patterns else []
+        self.request = request
         self.respect_robots = request.respect_robots_txt
         self._robots_parser = robotexclusionrulesparser.RobotExclusionRulesParser()
-        self._load_robots_txt(str(request.url))
+        # Memoized per-URL robots verdicts; the parser regexes are not
+        # re-evaluated for links already seen this crawl
+        self._robots_decisions: Dict[str, bool] = {}
+        self._robots_key = (urlparse(str(request.url)).scheme, self.base_domain)
+        self._robots_loaded = False
 
-    def _load_robots_txt(self, url: str) -> None:
-        """Load and parse robots.txt if it exists"""
+    async def ensure_robots(self, http_client=None) -> None:
+        """
+        Load robots.txt for the crawl's host, once per host process-wide.
+
+        Uses the shared httpx.AsyncClient when provided; falls back to a
+        requests call off the event loop. Called by CrawlerService at the
+        start of a crawl instead of blocking in __init__.
+        """
+        if not self.respect_robots or self._robots_loaded:
+            return
+
+        cached = _robots_cache.get(self._robots_key)
+        if cached is not None:
+            self._robots_parser = cached
+            self._robots_loaded = True
+            return
+
+        scheme, netloc = self._robots_key
+        robots_url = f"{scheme}://{netloc}/robots.txt"
+        fetched = False
         try:
-            if self.respect_robots:
-                parsed_url = urlparse(url)
-                robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-                response = requests.get(robots_url, timeout=10)
-                if response.status_code == 200:
-                    self._robots_parser.parse(response.text)
+            if http_client is not None:
+                response = await http_client.get(robots_url)
+            else:
+                import asyncio
+                response = await asyncio.to_thread(requests.get, robots_url, timeout=10)
+            if response.status_code == 200:
+                self._robots_parser.parse(response.text)
+            # Any response is a definitive answer (a 404 means no rules),
+            # so it is safe to share process-wide
+            fetched = True
         except Exception as e:
             logger.warning(f"Failed to load robots.txt: {e}")
 
+        # On a fetch error the allow-all fallback stays scoped to this
+        # crawl; caching it would let one transient network failure
+        # disable robots compliance for the host until restart
+        if fetched:
+            _robots_cache[self._robots_key] = self._robots_parser
+        self._robots_loaded = True
+
     def _is_allowed_by_robots(self, url: str) -> bool:
-        """Check if URL is allowed by robots.txt"""
+        """Check if URL is allowed by robots.txt (memoized per URL)"""
         if not self.respect_robots:
             return True
-        return self._robots_parser.is_allowed("*", url)
+        allowed = self._robots_decisions.get(url)
+        if allowed is None:
+            allowed = self._robots_parser.is_allowed("*", url)
+            self._robots_decisions[url] = allowed
+        return allowed
 
-    def _normalize_url(self, url: str, base_url: str) -> Optional[str]:
-        """Normalize URL to absolute form and clean it"""
-        try:
-            # Convert to absolute URL
-            absolute_url = urljoin(base_url, url)
-            
-            # Parse URL
-            parsed = urlparse(absolute_url)
-            
-            # Basic normalization
-            normalized = parsed._replace(
-                fragment="",  # Remove fragments
-                params="",    # Remove params
-                query=""     # Remove query string
-            ).geturl()
-            
-            return normalized
-        except Exception as e:
-            logger.debug(f"URL normalization failed for {url}: {e}")
-            return None
-
-    def _should_include_url(self, url: str) -> bool:
+    def _should_include_url(self, url: str, netloc: str) -> bool:
         """
         Check if URL should be included based on patterns and domain.
-        
+
         Args:
             url (str): URL to check
-            
+            netloc (str): The URL's netloc, as returned by normalization
+
         Returns:
             bool: True if URL should be included
         """
         # Check domain
-        if urlparse(url).netloc != self.base_domain:
+        if netloc != self.base_domain:
             return False
 
-        # Check exclude patterns
-        for pattern in self.exclude_patterns:
-            if pattern.search(url):
-                return False
-
-        # Check include patterns
-        if self.include_patterns:
-            return any(pattern.search(url) for pattern in self.include_patterns)
+        # Check patterns via the request's precompiled union regexes
+        if self.request.matches_exclude(url):
+            return False
 
-        return True
+        return self.request.matches_include(url)
 
-    def extract_links(self, html: str, base_url: str) -> Set[str]:
+    def extract_links(self, html: str, base_url: str) -> List[str]:
         """
         Extract valid links from HTML content.
-        
+
         Args:
             html (str): HTML content to parse
             base_url (str): Base URL for resolving relative links
-            
+
         Returns:
-            Set[str]: Set of valid, normalized URLs
+            List[str]: Valid normalized URLs, deduplicated in document order
         """
-        valid_links: Set[str] = set()
+        # dict preserves insertion order, giving ordered dedupe so the
+        # crawl visits links in discovery order
+        valid_links: Dict[str, None] = {}
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find all links
-            for link in soup.find_all('a', href=True):
-                url = link['href']
-                
-                # Normalize URL
-                normalized_url = self._normalize_url(url, base_url)
-                if not normalized_url:
+            # Parse with lxml directly: the tree stays in C and the xpath
+            # hands back href strings without materializing a Python
+            # wrapper object per anchor the way BeautifulSoup does
+            tree = lxml_html.fromstring(html)
+
+            for url in tree.xpath('//a/@href'):
+                # Normalize URL (cached across pages)
+                normalized = _normalize_url_cached(url, base_url)
+                if not normalized:
                     continue
+                normalized_url, netloc = normalized
 
                 # Apply all filters
-                if (self._should_include_url(normalized_url) and 
+                if (self._should_include_url(normalized_url, netloc) and
                     self._is_allowed_by_robots(normalized_url)):
-                    valid_links.add(normalized_url)
+                    valid_links.setdefault(normalized_url)
 
         except Exception as e:
             logger.error(f"Error extracting links from {base_url}: {e}")
 
-        return valid_links
\ No newline at end of file
+        return list(valid_links)
\ No newline at end of file
@@ -30,6 +30,7 @@ class QueueManager:
         self.rate_limit_delay = 0.0  # seconds between requests
         self.last_request_time = 0.0
         self._lock = asyncio.Lock()
+        self._closed = False
 
     async def add_url(self, url: str, depth: int = 0, parent_url: Optional[str] = None) -> bool:
         """
@@ -44,8 +45,9 @@ class QueueManager:
             bool: True if URL was added, False if skipped
         """
         async with self._lock:
-            if (url not in self.seen_urls and 
-                depth <= self.max_depth and 
+            if (not self._closed and
+                url not in self.seen_urls and
+                depth <= self.max_depth and
                 len(self.seen_urls) < self.max_pages):
                 
                 # self.queue.append(url)
@@ -82,6 +84,40 @@ class QueueManager:
             
             return url
 
+    async def get_next_url_blocking(self) -> Optional[str]:
+        """
+        Wait for the next URL to crawl, blocking until one is available.
+
+        Returns:
+            Optional[str]: Next URL, or None once the queue has been closed
+        """
+        url = await self.queue.get()
+        if url is None:
+            return None
+
+        async with self._lock:
+            # Apply rate limiting
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            if time_since_last < self.rate_limit_delay:
+                await asyncio.sleep(self.rate_limit_delay - time_since_last)
+
+            self.in_progress.add(url)
+            self.last_request_time = time.time()
+
+        return url
+
+    def close(self, n_workers: int) -> None:
+        """
+        Close the queue, waking up to n_workers blocked consumers with
+        sentinels. Idempotent; further add_url calls are rejected.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for _ in range(n_workers):
+            self.queue.put_nowait(None)
+
     async def mark_complete(self, url: str) -> None:
         """Mark a URL as completed"""
         async with self._lock:
@@ -1,5 +1,6 @@
 from datetime import timedelta
 from typing import Dict, Any, List, Optional, Set
+from urllib.parse import urljoin
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -8,12 +9,15 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import WebDriverException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from cachetools import LRUCache
+import hashlib
 import html2text
 from loguru import logger
 import base64
 import re, sys
 import asyncio
+import threading
 from functools import wraps
 from concurrent.futures import ThreadPoolExecutor
 import time
@@ -27,11 +31,69 @@ from services.cache import cache_service
 from services.cache.cache_service import CacheService
 from services.extractors.structured_data import StructuredDataExtractor
 
-# Metrics for monitoring
+settings = get_settings()
+
+# Metrics for monitoring. Histograms carry explicit workload-fit buckets
+# instead of the 15 prometheus defaults, halving per-observation bucket
+# updates; every mutation goes through _inc/_obs so disabling metrics
+# skips the client's lock entirely.
 from prometheus_client import Counter, Histogram, Gauge
-SCRAPE_REQUESTS = Counter('scraper_requests_total', 'Total number of scrape requests')
-SCRAPE_ERRORS = Counter('scraper_errors_total', 'Total number of scrape errors')
-SCRAPE_DURATION = Histogram('scraper_duration_seconds', 'Time spent scraping URLs')
+
+METRICS_ENABLED = settings.METRICS_ENABLED
+
+def _inc(counter) -> None:
+    if METRICS_ENABLED:
+        counter.inc()
+
+def _obs(histogram, value: float) -> None:
+    if METRICS_ENABLED:
+        histogram.observe(value)
+
+class _BatchedCounter:
+    """Buffers increments for a hot Counter in a plain int.
+
+    prometheus_client takes a threading.Lock on every inc(); for
+    counters hit on each request that lock is pure overhead on the
+    event loop. Increments accumulate locally and flush to the real
+    counter every `batch` ops or once `interval` seconds have passed;
+    the metrics endpoint calls flush() before exposition so increments
+    stranded by an idle period are still reported.
+    """
+
+    __slots__ = ('_counter', '_pending', '_batch', '_interval', '_last_flush')
+
+    def __init__(self, counter, batch: int = 64, interval: float = 1.0):
+        self._counter = counter
+        self._pending = 0
+        self._batch = batch
+        self._interval = interval
+        self._last_flush = time.monotonic()
+
+    def inc(self) -> None:
+        self._pending += 1
+        now = time.monotonic()
+        if self._pending >= self._batch or now - self._last_flush >= self._interval:
+            self._counter.inc(self._pending)
+            self._pending = 0
+            self._last_flush = now
+
+    def flush(self) -> None:
+        """Push any buffered increments into the underlying counter"""
+        if self._pending:
+            self._counter.inc(self._pending)
+            self._pending = 0
+        self._last_flush = time.monotonic()
+
+def flush_batched_counters() -> None:
+    """Flush all batched counters; called on the /metrics path so the
+    exposition always reflects increments made since the last flush"""
+    SCRAPE_REQUESTS.flush()
+    SCRAPE_ERRORS.flush()
+
+SCRAPE_REQUESTS = _BatchedCounter(Counter('scraper_requests_total', 'Total number of scrape requests'))
+SCRAPE_ERRORS = _BatchedCounter(Counter('scraper_errors_total', 'Total number of scrape errors'))
+SCRAPE_DURATION = Histogram('scraper_duration_seconds', 'Time spent scraping URLs',
+                            buckets=(1, 2.5, 5, 10, 30, 60))
 
 # Browser Pool Metrics
 BROWSER_POOL_SIZE = Gauge('browser_pool_size', 'Current number of browsers in pool')
@@ -43,19 +105,20 @@ BROWSER_CLEANUP_TOTAL = Counter('browser_cleanup_total', 'Total number of browse
 # Browser Health Metrics
 BROWSER_MEMORY_USAGE = Histogram('browser_memory_usage_bytes', 'Browser memory usage in bytes',
                                 buckets=[100*1024*1024, 500*1024*1024, 1024*1024*1024])  # 100MB, 500MB, 1GB buckets
-BROWSER_HEALTH_CHECK_DURATION = Histogram('browser_health_check_seconds', 'Time spent on browser health checks')
+BROWSER_HEALTH_CHECK_DURATION = Histogram('browser_health_check_seconds', 'Time spent on browser health checks',
+                                          buckets=(0.01, 0.05, 0.1, 0.5, 1))
 
 # Navigation Metrics
-PAGE_LOAD_DURATION = Histogram('page_load_duration_seconds', 'Time taken for page loads')
-NETWORK_IDLE_WAIT_DURATION = Histogram('network_idle_wait_seconds', 'Time spent waiting for network idle')
+PAGE_LOAD_DURATION = Histogram('page_load_duration_seconds', 'Time taken for page loads',
+                               buckets=(0.5, 1, 2, 5, 10, 30))
+NETWORK_IDLE_WAIT_DURATION = Histogram('network_idle_wait_seconds', 'Time spent waiting for network idle',
+                                       buckets=(0.1, 0.5, 1, 2, 5))
 
 # Cloudflare Metrics
 CLOUDFLARE_CHALLENGES = Counter('cloudflare_challenges_total', 'Number of Cloudflare challenges encountered')
 CLOUDFLARE_BYPASS_SUCCESS = Counter('cloudflare_bypass_success_total', 'Successful Cloudflare challenge bypasses')
 CLOUDFLARE_BYPASS_FAILURE = Counter('cloudflare_bypass_failure_total', 'Failed Cloudflare challenge bypasses')
 
-settings = get_settings()
-
 def with_retry(max_retries: int = 3, delay: float = 1.0):
     """Decorator for retry logic"""
     def decorator(func):
@@ -84,37 +147,109 @@ def safe_get_url(browser: webdriver.Chrome, url: str, timeout: int):
     browser.set_page_load_timeout(timeout)
     return browser.get(url)
 
+# Hot-path constants hoisted to module scope: the regex is compiled and the
+# tag/attribute sets are allocated once at import instead of per page (the
+# attribute whitelist was previously rebuilt inside the per-tag loop)
+_RE_CONTENT_MARKER = re.compile(r'content|main|article', re.I)
+_MAIN_CONTENT_PATTERNS = [
+    {'tag': 'main'},
+    {'tag': 'article'},
+    {'tag': 'div', 'id': _RE_CONTENT_MARKER},
+    {'tag': 'div', 'class': _RE_CONTENT_MARKER},
+    {'tag': 'div', 'role': 'main'}
+]
+_DECOMPOSE_TAGS = frozenset((
+    'script', 'style', 'iframe', 'nav', 'footer',
+    'noscript', 'meta', 'link', 'comment'
+))
+_ALLOWED_ATTRS = frozenset(('href', 'src', 'alt', 'title'))
+
+# lxml is the C-backed parser; html.parser walks the document in pure
+# Python and is several times slower on real pages
+_SOUP_PARSER = 'lxml'
+
+# Meta-tag name/property -> metadata key, inverted from the old
+# key -> [names] mapping so each meta tag costs one hash lookup instead
+# of a scan over every mapping
+_META_KEY_MAP = {
+    'og:title': 'title',
+    'description': 'description',
+    'og:description': 'description',
+    'language': 'language',
+    'og:locale': 'language',
+    'author': 'author',
+    'article:author': 'author',
+    'article:published_time': 'published_date',
+    'publisheddate': 'published_date',
+    'keywords': 'keywords',
+    'og:image': 'image'
+}
+
+def _new_html2text() -> html2text.HTML2Text:
+    """Build a converter for a single handle() call.
+
+    HTML2Text is an HTMLParser subclass that mutates per-call state while
+    converting, so one instance must not be shared across the executor
+    threads that run _extract_sync concurrently. Construction is cheap
+    next to the parse it feeds.
+    """
+    handler = html2text.HTML2Text()
+    handler.ignore_links = False
+    handler.ignore_images = False
+    handler.ignore_tables = False
+    handler.body_width = 0
+    return handler
+
 class ContentExtractor:
     """Enhanced content extraction with better cleaning and extraction logic"""
     
     def __init__(self):
-        self.html2text_handler = html2text.HTML2Text()
-        self.html2text_handler.ignore_links = False
-        self.html2text_handler.ignore_images = False
-        self.html2text_handler.ignore_tables = False
-        self.html2text_handler.body_width = 0
+        # Memoizes full extraction results by content hash; paginated
+        # crawls frequently re-fetch identical pages (nav shells, shared
+        # templates) and can skip the parse+convert entirely. cachetools
+        # caches are not thread-safe and _extract_sync runs on executor
+        # threads, so every access goes through the lock
+        self._result_cache = LRUCache(maxsize=64)
+        self._cache_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
-    def _clean_html(self, html: str) -> str:
-        """Clean HTML content with enhanced filtering"""
+    def _clean_html(self, node) -> str:
+        """Clean HTML content with enhanced filtering.
+
+        Accepts either an HTML string or an already-parsed tag, so callers
+        holding a tree can have it cleaned in place without a
+        serialize/re-parse round-trip.
+        """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup.find_all([
-                'script', 'style', 'iframe', 'nav', 'footer',
-                'noscript', 'meta', 'link', 'comment'
-            ]):
-                element.decompose()
-            
-            # Clean attributes
-            for tag in soup.find_all(True):
-                allowed_attrs = ['href', 'src', 'alt', 'title']
-                attrs = dict(tag.attrs)
-                for attr in attrs:
-                    if attr not in allowed_attrs:
-                        del tag[attr]
-            
-            return str(soup)
+            if isinstance(node, str):
+                node = BeautifulSoup(node, _SOUP_PARSER)
+
+            # find_all(True) walks descendants only, so the root gets the
+            # same treatment here; otherwise a selected main-content
+            # container would keep its class/style/data-* attributes in
+            # the cleaned output. (A soup root has no name match and no
+            # attrs, so this is a no-op for string input.)
+            if node.name in _DECOMPOSE_TAGS:
+                return ''
+            for attr in list(node.attrs):
+                if attr not in _ALLOWED_ATTRS:
+                    del node.attrs[attr]
+
+            # Single walk: drop unwanted tags and scrub attributes on the
+            # rest. find_all materializes its result list up front, so
+            # decomposing while iterating is safe; tags destroyed along
+            # with a decomposed ancestor are skipped.
+            for tag in node.find_all(True):
+                if tag.decomposed:
+                    continue
+                if tag.name in _DECOMPOSE_TAGS:
+                    tag.decompose()
+                    continue
+                for attr in list(tag.attrs):
+                    if attr not in _ALLOWED_ATTRS:
+                        del tag.attrs[attr]
+
+            return str(node)
         except Exception as e:
             logger.error(f"HTML cleaning failed: {str(e)}")
             raise
@@ -122,81 +257,257 @@ class ContentExtractor:
     def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, str]:
         """Extract comprehensive metadata from HTML"""
         metadata = {}
-        
-        # Get title with fallbacks
-        title_tag = (
-            soup.find('meta', property='og:title') or 
-            soup.find('title')
-        )
-        if title_tag:
-            metadata['title'] = title_tag.get('content', '') or title_tag.string
-            
-        # Get meta tags with prioritized mappings
-        meta_mappings = {
-            'description': ['description', 'og:description'],
-            'language': ['language', 'og:locale'],
-            'author': ['author', 'article:author'],
-            'published_date': ['article:published_time', 'publishedDate'],
-            'keywords': ['keywords'],
-            'image': ['og:image']
-        }
-        
+
+        # Map meta tags to metadata keys; setdefault keeps the first
+        # occurrence instead of silently letting later tags win
         for meta in soup.find_all('meta'):
             name = meta.get('name') or meta.get('property')
             content = meta.get('content')
-            
+
             if name and content:
-                for key, possible_names in meta_mappings.items():
-                    if name.lower() in possible_names:
-                        metadata[key] = content.strip()
-        
+                key = _META_KEY_MAP.get(name.lower())
+                if key:
+                    metadata.setdefault(key, content.strip())
+
+        # <title> fallback when no og:title meta was present
+        if 'title' not in metadata:
+            title_tag = soup.title
+            if title_tag and title_tag.string:
+                metadata['title'] = title_tag.string
+
         return metadata
 
-    def _find_main_content(self, soup: BeautifulSoup) -> Optional[str]:
-        """Enhanced main content detection"""
-        content_patterns = [
-            {'tag': 'main'},
-            {'tag': 'article'},
-            {'tag': 'div', 'id': re.compile(r'content|main|article', re.I)},
-            {'tag': 'div', 'class': re.compile(r'content|main|article', re.I)},
-            {'tag': 'div', 'role': 'main'}
-        ]
-        
-        for pattern in content_patterns:
+    def _find_main_content(self, soup: BeautifulSoup) -> Optional[Tag]:
+        """Enhanced main content detection.
+
+        Returns the matching tag itself rather than its serialized form so
+        the caller can keep working on the already-parsed tree.
+        """
+        for pattern in _MAIN_CONTENT_PATTERNS:
             element = soup.find(**pattern)
             if element:
-                return str(element)
-        
+                return element
+
         # Fallback: Find largest text container
         containers = soup.find_all(['div', 'section'])
         if containers:
-            return str(max(containers, key=lambda x: len(x.get_text())))
-        
+            return max(containers, key=lambda x: len(x.get_text()))
+
         return None
 
-    async def extract_content(self, html: str, only_main: bool = True) -> Dict[str, Any]:
-        """Main content extraction method with error handling"""
+    async def extract_content(self, html: str, only_main: bool = True,
+                              base_url: Optional[str] = None) -> Dict[str, Any]:
+        """Main content extraction method with error handling.
+
+        The body is pure CPU (parse, clean, markdown-convert), so it runs
+        on an executor thread; the event loop keeps driving the other
+        browser contexts while extraction is in flight, and lxml releases
+        the GIL during the C parse. When base_url is given, the page's
+        anchors are harvested from the same tree and resolved against it.
+        """
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return await self._loop.run_in_executor(
+            None, self._extract_sync, html, only_main, base_url
+        )
+
+    def _extract_sync(self, html: str, only_main: bool,
+                      base_url: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous extraction body; see extract_content"""
+        cache_key = (hashlib.blake2b(html.encode(), digest_size=16).digest(),
+                     only_main, base_url)
+        with self._cache_lock:
+            cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             metadata = self._extract_metadata(soup)
-            
+
+            # Harvest anchors from the same tree before cleaning strips
+            # their attributes; resolved to absolute form like the
+            # browser-side a.href the callers used to round-trip for
+            links = [
+                urljoin(base_url, a['href']) if base_url else a['href']
+                for a in soup.find_all('a', href=True)
+            ]
+
+            # Reuse the tree parsed above: the selected tag (or the whole
+            # soup) is cleaned in place rather than serialized and parsed
+            # a second time
+            target = soup
             if only_main:
                 content = self._find_main_content(soup)
-                if content:
-                    html = content
-            
-            clean_html = self._clean_html(html)
-            markdown = self.html2text_handler.handle(clean_html)
-            
-            return {
+                if content is not None:
+                    target = content
+
+            clean_html = self._clean_html(target)
+            markdown = _new_html2text().handle(clean_html)
+
+            result = {
                 'html': clean_html,
                 'markdown': markdown,
-                'metadata': metadata
+                'metadata': metadata,
+                'links': links
             }
+            with self._cache_lock:
+                self._result_cache[cache_key] = result
+            return result
         except Exception as e:
             logger.error(f"Content extraction failed: {str(e)}")
             raise
 
+# Anti-detection payloads, built once at import and applied per context.
+# Both stealth scripts are registered through a single
+# Page.addScriptToEvaluateOnNewDocument call so hardening costs one CDP
+# round-trip fewer per context setup.
+_STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+
+    // Hide automation-related properties
+    const automationProperties = ['__webdriver_evaluate', '__selenium_evaluate',
+        '__webdriver_script_function', '__webdriver_script_func', '__webdriver_script_fn',
+        '__fxdriver_evaluate', '__driver_unwrapped', '__webdriver_unwrapped',
+        '__driver_evaluate', '__selenium_unwrapped', '__fxdriver_unwrapped'];
+
+    automationProperties.forEach(prop => {
+        Object.defineProperty(document, prop, {
+            get: () => undefined,
+            set: () => undefined
+        });
+    });
+
+    window.chrome = {
+        app: {
+            isInstalled: false,
+            InstallState: {
+                DISABLED: 'disabled',
+                INSTALLED: 'installed',
+                NOT_INSTALLED: 'not_installed'
+            },
+            RunningState: {
+                CANNOT_RUN: 'cannot_run',
+                READY_TO_RUN: 'ready_to_run',
+                RUNNING: 'running'
+            }
+        },
+        runtime: {
+            OnInstalledReason: {
+                CHROME_UPDATE: 'chrome_update',
+                INSTALL: 'install',
+                SHARED_MODULE_UPDATE: 'shared_module_update',
+                UPDATE: 'update'
+            },
+            OnRestartRequiredReason: {
+                APP_UPDATE: 'app_update',
+                OS_UPDATE: 'os_update',
+                PERIODIC: 'periodic'
+            },
+            PlatformArch: {
+                ARM: 'arm',
+                ARM64: 'arm64',
+                MIPS: 'mips',
+                MIPS64: 'mips64',
+                X86_32: 'x86-32',
+                X86_64: 'x86-64'
+            },
+            PlatformNaclArch: {
+                ARM: 'arm',
+                MIPS: 'mips',
+                MIPS64: 'mips64',
+                X86_32: 'x86-32',
+                X86_64: 'x86-64'
+            },
+            PlatformOs: {
+                ANDROID: 'android',
+                CROS: 'cros',
+                LINUX: 'linux',
+                MAC: 'mac',
+                OPENBSD: 'openbsd',
+                WIN: 'win'
+            },
+            RequestUpdateCheckStatus: {
+                NO_UPDATE: 'no_update',
+                THROTTLED: 'throttled',
+                UPDATE_AVAILABLE: 'update_available'
+            }
+        }
+    };
+"""
+
+_STEALTH_USER_AGENT = {
+    "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    "platform": "Windows"
+}
+
+_STEALTH_HEADERS = {
+    "headers": {
+        "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "accept-language": "en-US,en;q=0.9",
+        "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"Windows"',
+        "sec-fetch-dest": "document",
+        "sec-fetch-mode": "navigate",
+        "sec-fetch-site": "none",
+        "sec-fetch-user": "?1",
+        "upgrade-insecure-requests": "1",
+        "cf-ipcountry": "US",
+        "cf-connecting-ip": "127.0.0.1",
+        "cf-ray": "",  # Cloudflare ray ID
+        "cf-visitor": '{"scheme":"https"}',
+        "cache-control": "no-cache",
+        "pragma": "no-cache",
+    }
+}
+
+# Asset patterns blocked at the network layer: the extractor discards
+# styling and media anyway, and images are already disabled at the blink
+# level, so downloading any of these is pure wasted bandwidth and delays
+# network idle
+_BLOCKED_URL_PATTERNS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3', '*.wav', '*.avi', '*.mov'
+)
+
+# Network-idle detection run via execute_async_script: resolves through the
+# WebDriver callback the moment three consecutive ticks see no new resource
+# entries, and is hard-bounded by the deadline passed in as its argument so
+# a chatty page cannot pin an executor thread indefinitely
+_NETWORK_IDLE_SCRIPT = """
+    const done = arguments[arguments.length - 1];
+    const deadline = Date.now() + arguments[0];
+    let lastCount = performance.getEntriesByType('resource').length;
+    let checkCount = 0;
+    const interval = setInterval(() => {
+        const currentCount = performance.getEntriesByType('resource').length;
+        if (currentCount === lastCount) {
+            checkCount++;
+            if (checkCount >= 3) {
+                clearInterval(interval);
+                done({resourceCount: currentCount, timedOut: false});
+                return;
+            }
+        } else {
+            checkCount = 0;
+            lastCount = currentCount;
+        }
+        if (Date.now() > deadline) {
+            clearInterval(interval);
+            done({resourceCount: currentCount, timedOut: true});
+        }
+    }, 100);
+"""
+
 class BrowserContext:
     """Enhanced browser context management with anti-detection and better logging"""
     def __init__(self, browser: webdriver.Chrome, config: Dict[str, Any]):
@@ -204,8 +515,17 @@ class BrowserContext:
         self.cloudflare_handler = CloudflareHandler()
         self.browser = browser
         self.config = config
+        # Contexts are only built inside coroutines; cache the loop so
+        # the per-call get_event_loop lookups disappear from the hot paths
+        self._loop = asyncio.get_running_loop()
         self.original_window = browser.current_window_handle
-        self._setup_browser()
+        # The CDP hardening (init scripts, UA/header overrides, blocked
+        # URLs) survives navigation and context cleanup, so a reused
+        # browser skips the setup round-trips. The flag lives on the
+        # driver because this wrapper is rebuilt on every acquisition.
+        if not getattr(browser, '_hardened', False):
+            self._setup_browser()
+            browser._hardened = True
 
     def _setup_browser(self):
         """Configure browser settings with anti-detection"""
@@ -222,128 +542,24 @@ class BrowserContext:
             self.browser.execute_cdp_cmd('Network.setBypassServiceWorker', {'bypass': True})
             self.browser.execute_cdp_cmd('Page.enable', {})
 
-            # Anti-detection measures
+            # Skip image/font/media downloads entirely unless a caller
+            # opts back in
+            if self.config.get('block_assets', True):
+                self.browser.execute_cdp_cmd('Network.setBlockedURLs', {
+                    'urls': list(_BLOCKED_URL_PATTERNS)
+                })
+
+            # Anti-detection measures: one merged init script, prebuilt
+            # UA/header payloads
             self.browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                "source": """
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['en-US', 'en']
-                    });
-                    window.chrome = {
-                        runtime: {}
-                    };
-                    
-                    // Hide automation-related properties
-                    const automationProperties = ['__webdriver_evaluate', '__selenium_evaluate',
-                        '__webdriver_script_function', '__webdriver_script_func', '__webdriver_script_fn',
-                        '__fxdriver_evaluate', '__driver_unwrapped', '__webdriver_unwrapped',
-                        '__driver_evaluate', '__selenium_unwrapped', '__fxdriver_unwrapped'];
-                    
-                    automationProperties.forEach(prop => {
-                        Object.defineProperty(document, prop, {
-                            get: () => undefined,
-                            set: () => undefined
-                        });
-                    });
-                """
+                "source": _STEALTH_INIT_SCRIPT
             })
 
             # Set realistic user agent and platform
-            self.browser.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                "platform": "Windows"
-            })
-
-            stealth_js = """
-                    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                    
-                    window.chrome = {
-                        app: {
-                            isInstalled: false,
-                            InstallState: {
-                                DISABLED: 'disabled',
-                                INSTALLED: 'installed',
-                                NOT_INSTALLED: 'not_installed'
-                            },
-                            RunningState: {
-                                CANNOT_RUN: 'cannot_run',
-                                READY_TO_RUN: 'ready_to_run',
-                                RUNNING: 'running'
-                            }
-                        },
-                        runtime: {
-                            OnInstalledReason: {
-                                CHROME_UPDATE: 'chrome_update',
-                                INSTALL: 'install',
-                                SHARED_MODULE_UPDATE: 'shared_module_update',
-                                UPDATE: 'update'
-                            },
-                            OnRestartRequiredReason: {
-                                APP_UPDATE: 'app_update',
-                                OS_UPDATE: 'os_update',
-                                PERIODIC: 'periodic'
-                            },
-                            PlatformArch: {
-                                ARM: 'arm',
-                                ARM64: 'arm64',
-                                MIPS: 'mips',
-                                MIPS64: 'mips64',
-                                X86_32: 'x86-32',
-                                X86_64: 'x86-64'
-                            },
-                            PlatformNaclArch: {
-                                ARM: 'arm',
-                                MIPS: 'mips',
-                                MIPS64: 'mips64',
-                                X86_32: 'x86-32',
-                                X86_64: 'x86-64'
-                            },
-                            PlatformOs: {
-                                ANDROID: 'android',
-                                CROS: 'cros',
-                                LINUX: 'linux',
-                                MAC: 'mac',
-                                OPENBSD: 'openbsd',
-                                WIN: 'win'
-                            },
-                            RequestUpdateCheckStatus: {
-                                NO_UPDATE: 'no_update',
-                                THROTTLED: 'throttled',
-                                UPDATE_AVAILABLE: 'update_available'
-                            }
-                        }
-                    };
-                """
-            self.browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': stealth_js
-            })
+            self.browser.execute_cdp_cmd('Network.setUserAgentOverride', _STEALTH_USER_AGENT)
 
             # Add stealth mode headers
-            self.browser.execute_cdp_cmd('Network.setExtraHTTPHeaders', {
-                "headers": {
-                    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "accept-language": "en-US,en;q=0.9",
-                    "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120"',
-                    "sec-ch-ua-mobile": "?0",
-                    "sec-ch-ua-platform": '"Windows"',
-                    "sec-fetch-dest": "document",
-                    "sec-fetch-mode": "navigate",
-                    "sec-fetch-site": "none",
-                    "sec-fetch-user": "?1",
-                    "upgrade-insecure-requests": "1",
-                    "cf-ipcountry": "US",
-                    "cf-connecting-ip": "127.0.0.1",
-                    "cf-ray": "",  # Cloudflare ray ID
-                    "cf-visitor": '{"scheme":"https"}',
-                    "cache-control": "no-cache",
-                    "pragma": "no-cache",
-                }
-            })
+            self.browser.execute_cdp_cmd('Network.setExtraHTTPHeaders', _STEALTH_HEADERS)
 
             logger.info("Browser setup completed successfully")
         except Exception as e:
@@ -357,8 +573,13 @@ class BrowserContext:
         
         try:
             self.browser.set_page_load_timeout(timeout)
-            self.browser.get(url)
-            
+            # browser.get blocks until the page-load strategy is satisfied;
+            # run it in the executor so the loop keeps servicing the other
+            # pool slots during navigation
+            await self._loop.run_in_executor(
+                None, self.browser.get, url
+            )
+
             # Check for Cloudflare
             if await self.cloudflare_handler.is_cloudflare_challenge(self.browser):
                 logger.info("Detected Cloudflare challenge, waiting for completion")
@@ -368,8 +589,12 @@ class BrowserContext:
                 )
                 if not challenge_complete:
                     raise Exception("Failed to bypass Cloudflare challenge")
-            
-            await self._wait_for_network_idle()
+
+            # With the eager load strategy the DOM is already usable here;
+            # only callers that ask for it pay the network-idle wait
+            if self.config.get('wait_strategy') == 'networkidle':
+                await self._wait_for_network_idle()
+            self.browser._last_ok = time.monotonic()
             logger.info(f"Navigation completed in {time.time() - start_time:.2f}s")
             
         except TimeoutException:
@@ -377,8 +602,10 @@ class BrowserContext:
             try:
                 self.browser.execute_script("window.stop();")
                 self.browser.set_page_load_timeout(timeout * 2)
-                self.browser.get(url)
-                
+                await self._loop.run_in_executor(
+                    None, self.browser.get, url
+                )
+
                 # Check for Cloudflare again after retry
                 if await self.cloudflare_handler.is_cloudflare_challenge(self.browser):
                     challenge_complete = await self.cloudflare_handler.wait_for_challenge_completion(
@@ -387,8 +614,10 @@ class BrowserContext:
                     )
                     if not challenge_complete:
                         raise Exception("Failed to bypass Cloudflare challenge")
-                        
-                await self._wait_for_network_idle()
+
+                if self.config.get('wait_strategy') == 'networkidle':
+                    await self._wait_for_network_idle()
+                self.browser._last_ok = time.monotonic()
                 logger.info(f"Navigation completed after retry in {time.time() - start_time:.2f}s")
             except Exception as e:
                 logger.error(f"Navigation failed even after retry: {str(e)}")
@@ -399,66 +628,50 @@ class BrowserContext:
         logger.debug("Waiting for network to become idle")
         try:
             start_time = time.time()
-            script = """
-                return new Promise((resolve) => {
-                    let lastCount = performance.getEntriesByType('resource').length;
-                    let checkCount = 0;
-                    const interval = setInterval(() => {
-                        const currentCount = performance.getEntriesByType('resource').length;
-                        if (currentCount === lastCount) {
-                            checkCount++;
-                            if (checkCount >= 3) {
-                                clearInterval(interval);
-                                resolve({
-                                    resourceCount: currentCount,
-                                    timeElapsed: performance.now()
-                                });
-                            }
-                        } else {
-                            checkCount = 0;
-                            lastCount = currentCount;
-                        }
-                    }, 333);
-                });
-            """
-            result = await asyncio.get_event_loop().run_in_executor(
+            self.browser.set_script_timeout(timeout + 1)
+            result = await self._loop.run_in_executor(
                 None,
-                lambda: self.browser.execute_script(script)
+                lambda: self.browser.execute_async_script(
+                    _NETWORK_IDLE_SCRIPT, int(timeout * 1000)
+                )
             )
+            _obs(NETWORK_IDLE_WAIT_DURATION, time.time() - start_time)
             logger.debug(f"Network idle achieved. Resources loaded: {result.get('resourceCount', 'unknown')}")
             logger.debug(f"Network idle wait took {time.time() - start_time:.2f}s")
         except Exception as e:
             logger.warning(f"Error waiting for network idle: {str(e)}")
 
     async def get_page_source(self) -> str:
-        """Get page source with retry mechanism and logging"""
+        """Get page source with logging.
+
+        page_source serializes the whole document and never raises
+        StaleElementReferenceException (that is an element-handle error),
+        so there is nothing to retry here; real WebDriver failures
+        propagate to the navigate-level retry.
+        """
         logger.debug("Attempting to get page source")
-        for attempt in range(3):
-            try:
-                source = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.browser.page_source
-                )
-                logger.debug(f"Page source retrieved successfully, size: {len(source)} bytes")
-                return source
-            except StaleElementReferenceException:
-                logger.warning(f"Stale element on attempt {attempt + 1}, retrying...")
-                if attempt == 2:
-                    logger.error("Failed to get page source after all retries")
-                    raise
-                await asyncio.sleep(0.5)
-
-    async def take_screenshot(self) -> str:
-        """Take screenshot with enhanced error handling and logging"""
+        source = await self._loop.run_in_executor(
+            None,
+            lambda: self.browser.page_source
+        )
+        logger.debug(f"Page source retrieved successfully, size: {len(source)} bytes")
+        self.browser._last_ok = time.monotonic()
+        return source
+
+    async def take_screenshot(self) -> Optional[bytes]:
+        """Take screenshot, returning raw PNG bytes.
+
+        Kept as bytes through the pipeline; base64 inflates the payload
+        by a third, so encoding happens once at the response boundary.
+        """
         logger.debug("Attempting to take screenshot")
         try:
-            screenshot = await asyncio.get_event_loop().run_in_executor(
+            screenshot = await self._loop.run_in_executor(
                 None,
                 lambda: self.browser.get_screenshot_as_png()
             )
-            encoded = base64.b64encode(screenshot).decode('utf-8')
-            logger.debug(f"Screenshot captured successfully, size: {len(encoded)} bytes")
-            return encoded
+            logger.debug(f"Screenshot captured successfully, size: {len(screenshot)} bytes")
+            return screenshot
         except Exception as e:
             logger.error(f"Screenshot failed: {str(e)}")
             return None
@@ -481,24 +694,58 @@ class BrowserContext:
         except Exception as e:
             logger.warning(f"Cleanup error: {str(e)}")
 
+# A browser that completed real work this recently is trusted without a
+# health-check RPC; the explicit check only runs for browsers that have
+# been idle longer
+_HEALTH_CHECK_TTL = 30.0
+
 class BrowserPool:
     """Enhanced browser pool management"""
-    def __init__(self, max_browsers: int = 3):
+    def __init__(self, max_browsers: int = 3, max_uses: int = 100):
         self.max_browsers = max_browsers
+        # Request budget per browser: long-lived Chrome processes leak
+        # memory, so each one is recycled after this many uses rather than
+        # growing unboundedly
+        self.max_uses = max_uses
         self.available_browsers: List[webdriver.Chrome] = []
         self.active_browsers: Set[webdriver.Chrome] = set()
+        # Every live Chrome the pool owns, including browsers that are in
+        # neither collection because a health check or release await is in
+        # flight; the creation cap checks this so those windows can't let
+        # the process count exceed max_browsers
+        self._total_browsers = 0
+        self.browser_uses: Dict[int, int] = {}
+        # Resolved chromedriver path, cached after the first lookup:
+        # ChromeDriverManager().install() checks the network and disk for a
+        # matching driver, which is far too slow to repeat per browser
+        self._driver_path: Optional[str] = None
+        # Dedicated teardown executor: browser.quit can take seconds, and
+        # queueing N of them on the shared default executor would block
+        # page-source/screenshot calls waiting behind them
+        self._quit_executor = ThreadPoolExecutor(
+            max_workers=max_browsers, thread_name_prefix="browser-quit"
+        )
+        # Event loop cached on first async entry; the pool may be built
+        # before the loop runs, so this cannot be resolved in __init__
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.lock = asyncio.Lock()
         self.browser_metrics = {
             'created': 0,
             'reused': 0,
             'failed': 0,
+            'recycled': 0,
             'current_active': 0
         }
 
     def _create_browser_options(self) -> Options:
         """Create optimized browser options"""
         options = Options()
-        
+
+        # Return from browser.get at DOMContentLoaded instead of the full
+        # load event; the extractor doesn't need subresources, and pages
+        # with long-polling beacons never finish loading anyway
+        options.page_load_strategy = 'eager'
+
         # Performance-focused options
         options.add_argument('--headless=new')
         options.add_argument('--disable-gpu')
@@ -525,37 +772,87 @@ class BrowserPool:
         
         return options
 
+    async def warmup(self, n: Optional[int] = None) -> None:
+        """
+        Pre-launch browsers and park them in the pool, moving Chrome
+        startup off the critical path of the first requests. Launches run
+        concurrently on executor threads; failures are logged and counted
+        but not fatal, since get_browser still creates lazily.
+        """
+        n = min(n or self.max_browsers, self.max_browsers)
+        logger.info(f"Warming up browser pool with {n} browsers")
+        loop = self._get_loop()
+
+        if self._driver_path is None:
+            self._driver_path = await loop.run_in_executor(
+                None, lambda: ChromeDriverManager().install()
+            )
+
+        def _launch() -> webdriver.Chrome:
+            return webdriver.Chrome(
+                service=Service(self._driver_path),
+                options=self._create_browser_options()
+            )
+
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, _launch) for _ in range(n)),
+            return_exceptions=True
+        )
+
+        async with self.lock:
+            for result in results:
+                if isinstance(result, Exception):
+                    self.browser_metrics['failed'] += 1
+                    logger.warning(f"Warmup browser launch failed: {result}")
+                    continue
+                self._total_browsers += 1
+                if self._total_browsers <= self.max_browsers:
+                    self.available_browsers.append(result)
+                    self.browser_metrics['created'] += 1
+                else:
+                    await self._safely_quit_browser(result)
+
     async def get_browser(self) -> BrowserContext:
         """Get a browser with context and metrics tracking"""
         logger.info("Requesting browser from pool")
-        async with self.lock:
-            try:
-                # Try to reuse an existing browser
-                while self.available_browsers:
-                    browser = self.available_browsers.pop()
-                    logger.debug(f"Testing available browser {id(browser)}")
-                    
-                    if await self._is_browser_healthy(browser):
-                        self.active_browsers.add(browser)
-                        self.browser_metrics['reused'] += 1
-                        self.browser_metrics['current_active'] = len(self.active_browsers)
-                        logger.info(f"Reusing existing browser {id(browser)}")
-                        return BrowserContext(browser, {
-                            'window_width': 1280,
-                            'window_height': 1024
-                        })
-                    else:
-                        logger.warning(f"Unhealthy browser {id(browser)} found, cleaning up")
-                        await self._safely_quit_browser(browser)
+        try:
+            # Reuse path is lock-free: the list mutations below are
+            # synchronous on the single event loop, and a popped browser
+            # is invisible to other coroutines while its health check
+            # awaits, so no second consumer can grab it
+            while self.available_browsers:
+                browser = self.available_browsers.pop()
+                logger.debug(f"Testing available browser {id(browser)}")
+
+                if self._recently_ok(browser) or await self._is_browser_healthy(browser):
+                    self.active_browsers.add(browser)
+                    self.browser_metrics['reused'] += 1
+                    self.browser_metrics['current_active'] = len(self.active_browsers)
+                    logger.info(f"Reusing existing browser {id(browser)}")
+                    return BrowserContext(browser, {
+                        'window_width': 1280,
+                        'window_height': 1024
+                    })
+                else:
+                    logger.warning(f"Unhealthy browser {id(browser)} found, cleaning up")
+                    await self._safely_quit_browser(browser)
 
-                # Create new browser if under limit
-                if len(self.active_browsers) < self.max_browsers:
+            # Creation stays serialized: the cap check and the launch are
+            # separated by awaits, so without the lock two coroutines
+            # could both pass the limit
+            async with self.lock:
+                if self._total_browsers < self.max_browsers:
                     logger.info("Creating new browser instance")
                     options = self._create_browser_options()
-                    service = Service(ChromeDriverManager().install())
-                    
+                    if self._driver_path is None:
+                        self._driver_path = await self._get_loop().run_in_executor(
+                            None, lambda: ChromeDriverManager().install()
+                        )
+                    service = Service(self._driver_path)
+
                     try:
                         browser = webdriver.Chrome(service=service, options=options)
+                        self._total_browsers += 1
                         self.active_browsers.add(browser)
                         self.browser_metrics['created'] += 1
                         self.browser_metrics['current_active'] = len(self.active_browsers)
@@ -572,9 +869,25 @@ class BrowserPool:
                     logger.error(f"Max browsers ({self.max_browsers}) reached")
                     raise BrowserError("Too many active browsers")
 
-            except Exception as e:
-                logger.error(f"Browser pool error: {str(e)}")
-                raise
+        except Exception as e:
+            logger.error(f"Browser pool error: {str(e)}")
+            raise
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Cached running loop; avoids a per-call asyncio lookup"""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    @staticmethod
+    def _recently_ok(browser: webdriver.Chrome) -> bool:
+        """Whether the browser finished real work within the health TTL.
+
+        Navigations and page-source fetches stamp the browser on success,
+        so the hot acquire/release paths can skip the blocking health RPC
+        for browsers that were demonstrably alive moments ago.
+        """
+        return time.monotonic() - getattr(browser, '_last_ok', 0.0) < _HEALTH_CHECK_TTL
 
     async def _is_browser_healthy(self, browser: webdriver.Chrome) -> bool:
         """Enhanced browser health check"""
@@ -583,14 +896,14 @@ class BrowserPool:
             start_time = time.time()
             
             # Basic connectivity check
-            await asyncio.get_event_loop().run_in_executor(
+            await self._get_loop().run_in_executor(
                 None,
                 lambda: browser.current_url
             )
             
             # Memory check (example threshold: 1GB)
             try:
-                memory_info = await asyncio.get_event_loop().run_in_executor(
+                memory_info = await self._get_loop().run_in_executor(
                     None,
                     lambda: browser.execute_script('return window.performance.memory.usedJSHeapSize')
                 )
@@ -600,7 +913,9 @@ class BrowserPool:
             except:
                 pass  # Memory check is optional
                 
+            _obs(BROWSER_HEALTH_CHECK_DURATION, time.time() - start_time)
             logger.debug(f"Browser {id(browser)} health check completed in {time.time() - start_time:.2f}s")
+            browser._last_ok = time.monotonic()
             return True
             
         except Exception as e:
@@ -612,39 +927,53 @@ class BrowserPool:
         if not context:
             return
 
-        async with self.lock:
-            browser = context.browser
-            browser_id = id(browser)
-            logger.info(f"Releasing browser {browser_id}")
-            
-            try:
-                await context.cleanup()
-                
-                if browser in self.active_browsers:
-                    self.active_browsers.remove(browser)
-                    self.browser_metrics['current_active'] = len(self.active_browsers)
-                    
-                    # Only reuse browser if pool not full and browser healthy
-                    if len(self.available_browsers) < self.max_browsers:
-                        if await self._is_browser_healthy(browser):
-                            self.available_browsers.append(browser)
-                            logger.info(f"Browser {browser_id} returned to pool")
-                            return
-                
-                logger.info(f"Closing browser {browser_id}")
-                await self._safely_quit_browser(browser)
-                
-            except Exception as e:
-                logger.error(f"Error releasing browser {browser_id}: {str(e)}")
-                await self._safely_quit_browser(browser)
+        # Lock-free like the reuse path: the browser leaves active_browsers
+        # synchronously, and is in no shared collection while the cleanup
+        # and health-check awaits run
+        browser = context.browser
+        browser_id = id(browser)
+        logger.info(f"Releasing browser {browser_id}")
+
+        try:
+            await context.cleanup()
+
+            if browser in self.active_browsers:
+                self.active_browsers.remove(browser)
+                self.browser_metrics['current_active'] = len(self.active_browsers)
+
+                # Enforce the per-browser request budget before reuse
+                uses = self.browser_uses.get(browser_id, 0) + 1
+                self.browser_uses[browser_id] = uses
+                if uses >= self.max_uses:
+                    logger.info(f"Browser {browser_id} hit request budget ({uses}), recycling")
+                    self.browser_metrics['recycled'] += 1
+                    self.browser_uses.pop(browser_id, None)
+                    await self._safely_quit_browser(browser)
+                    return
+
+                # Only reuse browser if pool not full and browser healthy
+                if len(self.available_browsers) < self.max_browsers:
+                    if self._recently_ok(browser) or await self._is_browser_healthy(browser):
+                        self.available_browsers.append(browser)
+                        logger.info(f"Browser {browser_id} returned to pool")
+                        return
+
+            logger.info(f"Closing browser {browser_id}")
+            await self._safely_quit_browser(browser)
+
+        except Exception as e:
+            logger.error(f"Error releasing browser {browser_id}: {str(e)}")
+            await self._safely_quit_browser(browser)
 
     async def _safely_quit_browser(self, browser: webdriver.Chrome):
         """Safely quit browser with cleanup verification"""
         browser_id = id(browser)
+        self._total_browsers = max(0, self._total_browsers - 1)
+        self.browser_uses.pop(browser_id, None)
         logger.debug(f"Quitting browser {browser_id}")
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
+            await self._get_loop().run_in_executor(
+                self._quit_executor,
                 browser.quit
             )
             logger.info(f"Browser {browser_id} quit successfully")
@@ -663,8 +992,10 @@ class BrowserPool:
             
             self.available_browsers.clear()
             self.active_browsers.clear()
+            self._total_browsers = 0
             self.browser_metrics['current_active'] = 0
-            
+
+            self._quit_executor.shutdown(wait=False)
             logger.info("Browser pool cleanup completed")
 
 class WebScraper:
@@ -676,9 +1007,22 @@ class WebScraper:
         self.structured_data_extractor = StructuredDataExtractor()
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.cache_service = None
-        # Keep track of browsers in use
-        self.active_browsers = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Dedicated executor for CPU-bound parsing so structured-data
+        # extraction never queues behind browser quits or other work on
+        # the shared default executor. Threads rather than processes:
+        # lxml does the heavy parsing in C and the per-page payloads
+        # would be pickled twice across a process boundary
+        self._cpu_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix="extract"
+        )
     
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Cached running loop; avoids a per-call asyncio lookup"""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
     @classmethod
     async def create(cls, max_concurrent: int = 5, cache_service: Optional[CacheService] = None) -> 'WebScraper':
         """Factory method for creating WebScraper instance with optional cache service"""
@@ -686,6 +1030,14 @@ class WebScraper:
         instance.cache_service = cache_service  # Set the cache service
         if instance.cache_service:
             await instance.cache_service.connect()
+
+        # Warm the pool at startup so the first requests reuse parked
+        # browsers instead of paying Chrome launch latency
+        try:
+            await instance.browser_pool.warmup()
+        except Exception as e:
+            logger.warning(f"Browser pool warmup failed: {e}")
+
         return instance
     
     async def _get_page_content(self, url: str, options: Dict[str, Any]) -> Dict[str, Any]:
@@ -697,48 +1049,55 @@ class WebScraper:
                 element_present = EC.presence_of_element_located(
                     (By.CSS_SELECTOR, options['wait_for_selector'])
                 )
-                WebDriverWait(context.browser, options.get('timeout', 30)).until(element_present)
+                wait_timeout = options.get('timeout', 30)
+                # WebDriverWait polls with time.sleep between checks; run
+                # it on a worker thread so the poll loop doesn't freeze
+                # every other in-flight scrape
+                await self._get_loop().run_in_executor(
+                    None,
+                    lambda: WebDriverWait(context.browser, wait_timeout).until(element_present)
+                )
 
             page_source = await context.get_page_source()
-            
+
+            # Eager loads occasionally beat client-side rendering; when
+            # the document looks skeletal, give the page one short idle
+            # window and refetch before extracting
+            if len(page_source) < 2000:
+                await context._wait_for_network_idle(timeout=5.0)
+                page_source = await context.get_page_source()
+
             screenshot = None
             if options.get('include_screenshot'):
                 screenshot = await context.take_screenshot()
 
-            links = context.browser.execute_script("""
-                return Array.from(document.getElementsByTagName('a')).map(a => ({
-                    href: a.href,
-                    text: a.textContent.trim(),
-                    rel: a.rel
-                }));
-            """)
-
+            # Links are harvested from the parsed page source during
+            # content extraction; no browser round-trip needed
             return {
                 'content': page_source,
                 'raw_content': page_source if options.get('include_raw_html') else None,
                 'status': 200,
                 'screenshot': screenshot,
-                'links': links,
                 'headers': {}
             }
 
         finally:
             await self.browser_pool.release_browser(context)
 
-    async def _release_browser(self, browser: webdriver.Chrome):
-        """Separate browser release method"""
-        if browser in self.active_browsers:
-            self.active_browsers.remove(browser)
-            await self.browser_manager.release_browser(browser)
- 
     async def scrape(self, url: str, options: Dict[str, Any]) -> Dict[str, Any]:
         """Main scraping method with caching"""
-        SCRAPE_REQUESTS.inc()
+        _inc(SCRAPE_REQUESTS)
         
         try:
-            # Check cache first if caching is enabled
+            # Check cache first if caching is enabled. Compute the key
+            # once here; the get and set below share it instead of each
+            # re-serializing the options dict
+            cache_key = None
             if self.cache_service and not options.get('bypass_cache'):
-                cached_result = await self.cache_service.get_cached_result(url, options)
+                cache_key = self.cache_service.make_key(url, options)
+                cached_result = await self.cache_service.get_cached_result(
+                    url, options, cache_key=cache_key
+                )
                 if cached_result:
                     return {
                         'success': True,
@@ -749,29 +1108,32 @@ class WebScraper:
             # If not cached or cache bypassed, proceed with scraping
             async with self.semaphore:
                 try:
-                    with SCRAPE_DURATION.time():
-                        # Get and process page content
-                        page_data = await self._get_page_content(url, options)
-                        processed_data = await self._process_page_data(page_data, options, url)
-                        
-                        # Cache the result if caching is enabled
-                        if self.cache_service and not options.get('bypass_cache'):
-                            cache_ttl = options.get('cache_ttl', getattr(settings, 'CACHE_TTL', 86400))  # Default to 24 hours
-                            await self.cache_service.cache_result(
-                                url, 
-                                options, 
-                                processed_data,
-                                ttl=timedelta(seconds=cache_ttl)
-                            )
-                        
-                        return {
-                            'success': True,
-                            'data': processed_data,
-                            'cached': False
-                        }
-                        
+                    scrape_started = time.perf_counter()
+
+                    # Get and process page content
+                    page_data = await self._get_page_content(url, options)
+                    processed_data = await self._process_page_data(page_data, options, url)
+
+                    # Cache the result if caching is enabled
+                    if self.cache_service and not options.get('bypass_cache'):
+                        cache_ttl = options.get('cache_ttl', getattr(settings, 'CACHE_TTL', 86400))  # Default to 24 hours
+                        await self.cache_service.cache_result(
+                            url,
+                            options,
+                            processed_data,
+                            ttl=timedelta(seconds=cache_ttl),
+                            cache_key=cache_key
+                        )
+
+                    _obs(SCRAPE_DURATION, time.perf_counter() - scrape_started)
+                    return {
+                        'success': True,
+                        'data': processed_data,
+                        'cached': False
+                    }
+
                 except Exception as e:
-                    SCRAPE_ERRORS.inc()
+                    _inc(SCRAPE_ERRORS)
                     logger.error(f"Scraping error for {url}: {str(e)}")
                     return {
                         'success': False,
@@ -798,7 +1160,7 @@ class WebScraper:
                     
         except Exception as e:
             logger.error(f"Unexpected error in scrape method: {str(e)}")
-            SCRAPE_ERRORS.inc()
+            _inc(SCRAPE_ERRORS)
             raise
 
     async def _process_page_data(self, page_data: Dict[str, Any], 
@@ -808,11 +1170,12 @@ class WebScraper:
             # Create content extraction tasks
             content_task = self.content_extractor.extract_content(
                 page_data['content'],
-                options.get('only_main', True)
+                options.get('only_main', True),
+                base_url=url
             )
 
-            structured_data_future = asyncio.get_event_loop().run_in_executor(
-                None,
+            structured_data_future = self._get_loop().run_in_executor(
+                self._cpu_executor,
                 self.structured_data_extractor.extract_all,
                 page_data['content']
             )
@@ -835,10 +1198,7 @@ class WebScraper:
             if processed_content.get('metadata'):
                 metadata.update(processed_content['metadata'])
 
-            formatted_links = [
-                link['href'] for link in page_data.get('links', [])
-                if link.get('href')
-            ] if page_data.get('links') else None
+            formatted_links = processed_content.get('links') or None
 
             return {
                 'markdown': processed_content['markdown'],
@@ -846,7 +1206,11 @@ class WebScraper:
                 'rawHtml': page_data['raw_content'],
                 'screenshot': None,
                 'links': formatted_links,
-                'actions': ({'screenshots': [page_data['screenshot']]} 
+                # Encode once here, at the JSON boundary; upstream the
+                # screenshot travels as raw PNG bytes
+                'actions': ({'screenshots': [
+                                base64.b64encode(page_data['screenshot']).decode('utf-8')
+                            ]}
                           if page_data.get('screenshot') else None),
                 'metadata': metadata,
                 'llm_extraction': None,
@@ -860,17 +1224,112 @@ class WebScraper:
     
     async def cleanup(self):
         """Cleanup resources"""
+        self._cpu_executor.shutdown(wait=False)
         await self.browser_pool.cleanup()
 
-class CloudflareHandler:
-    def __init__(self):
-        self.cf_challenge_selectors = [
-            "#challenge-form",
-            "#challenge-running",
-            "div[class*='cf-browser-verification']",
-            "#cf-challenge-running"
-        ]
+class ScrapeBatcher:
+    """Coalesces concurrent scrape requests into micro-batches.
+
+    Requests arriving within a small window are picked up together and
+    dispatched as one gather through the shared scraper, amortizing
+    browser-pool churn across the batch instead of paying it per call.
+    Each caller still gets its own result via a future.
+    """
 
+    def __init__(self, scraper: 'WebScraper', max_batch: int = 8, window: float = 0.02):
+        self.scraper = scraper
+        self.max_batch = max_batch
+        self.window = window
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        # Strong refs to in-flight batch tasks; the done-callback discard
+        # keeps the set from pinning completed ones
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def start(self):
+        """Start the background coalescer task"""
+        if not self._task:
+            self._task = asyncio.create_task(self._worker())
+            logger.info("Scrape batcher started")
+
+    async def stop(self):
+        """Stop the coalescer, cancelling the worker task"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._dispatches:
+            # Let in-flight batches finish so their callers' futures
+            # resolve instead of hanging across shutdown
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+        logger.info("Scrape batcher stopped")
+
+    async def scrape(self, url: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Enqueue a scrape and wait for its result"""
+        fut = asyncio.get_running_loop().create_future()
+        await self.queue.put((url, options, fut))
+        return await fut
+
+    async def _collect_batch(self) -> list:
+        """Block for the first request, then coalesce arrivals within the window"""
+        batch = [await self.queue.get()]
+        try:
+            while len(batch) < self.max_batch:
+                item = await asyncio.wait_for(self.queue.get(), timeout=self.window)
+                batch.append(item)
+        except asyncio.TimeoutError:
+            pass
+        return batch
+
+    async def _worker(self):
+        while True:
+            batch = await self._collect_batch()
+            logger.debug(f"Dispatching scrape micro-batch of {len(batch)}")
+            # Fire and return to collecting: awaiting the batch here would
+            # head-of-line block every new arrival behind the slowest URL
+            # of the current batch. The scraper's semaphore still bounds
+            # how many of these run at once.
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list) -> None:
+        """Run one collected batch and resolve its callers' futures"""
+        results = await asyncio.gather(
+            *(self.scraper.scrape(url, options) for url, options, _ in batch),
+            return_exceptions=True
+        )
+        for (_, _, fut), result in zip(batch, results):
+            if fut.cancelled():
+                continue
+            if isinstance(result, Exception):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+
+# Cloudflare fingerprints, built once: a handler is constructed per
+# BrowserContext, so these must not be re-allocated per acquisition.
+# The selectors are comma-joined so detection is a single find_elements
+# round-trip instead of one WebDriver RPC per selector.
+_CF_CHALLENGE_SELECTOR = ", ".join((
+    "#challenge-form",
+    "#challenge-running",
+    "div[class*='cf-browser-verification']",
+    "#cf-challenge-running"
+))
+# One case-insensitive alternation over the known challenge phrases: a
+# single C-level scan of the raw source, with no lowercased copy of the
+# whole document
+_CF_SOURCE_RE = re.compile(
+    r"cloudflare|ray id:|please wait while we verify|"
+    r"please enable cookies|please complete the security check",
+    re.I
+)
+
+class CloudflareHandler:
     async def is_cloudflare_challenge(self, browser: webdriver.Chrome) -> bool:
         """Check if page has Cloudflare challenge"""
         try:
@@ -880,30 +1339,19 @@ class CloudflareHandler:
                 logger.info("Detected Cloudflare challenge page by title")
                 return True
                 
-            # Check for challenge elements
-            for selector in self.cf_challenge_selectors:
-                try:
-                    if browser.find_element(By.CSS_SELECTOR, selector):
-                        logger.info(f"Detected Cloudflare challenge element: {selector}")
-                        return True
-                except:
-                    continue
-                    
+            # Check for challenge elements; find_elements returns an empty
+            # list (no exception) when nothing matches
+            if browser.find_elements(By.CSS_SELECTOR, _CF_CHALLENGE_SELECTOR):
+                logger.info("Detected Cloudflare challenge element")
+                return True
+
+
             # Check page source for common Cloudflare text
-            page_source = browser.page_source.lower()
-            cf_indicators = [
-                "cloudflare",
-                "ray id:",
-                "please wait while we verify",
-                "please enable cookies",
-                "please complete the security check"
-            ]
-            
-            for indicator in cf_indicators:
-                if indicator in page_source:
-                    logger.info(f"Detected Cloudflare challenge by text: {indicator}")
-                    return True
-                    
+            match = _CF_SOURCE_RE.search(browser.page_source)
+            if match:
+                logger.info(f"Detected Cloudflare challenge by text: {match.group(0)}")
+                return True
+
             return False
             
         except Exception as e: